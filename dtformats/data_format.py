@@ -25,6 +25,10 @@ class BinaryDataFormat(object):
   # at run-time.
   _DEFINITION_FILES_PATH = os.path.dirname(__file__)
 
+  # The dtFabric fabrics of the definition files that have been read, which
+  # are shared between the classes that use the same definition file.
+  _DEFINITION_FILES_FABRICS = {}
+
   _HEXDUMP_CHARACTER_MAP = [
       '.' if byte < 0x20 or byte > 0x7e else chr(byte) for byte in range(256)]
 
@@ -661,6 +665,9 @@ class BinaryDataFormat(object):
   def ReadDefinitionFile(cls, filename):
     """Reads a dtFabric definition file.
 
+    The definition file is only read and parsed once, subsequent calls with
+    the same filename return the same data type fabric.
+
     Args:
       filename (str): name of the dtFabric definition file.
 
@@ -673,10 +680,16 @@ class BinaryDataFormat(object):
       return None
 
     path = os.path.join(cls._DEFINITION_FILES_PATH, filename)
-    with open(path, 'rb') as file_object:
-      definition = file_object.read()
 
-    return dtfabric_fabric.DataTypeFabric(yaml_definition=definition)
+    fabric = cls._DEFINITION_FILES_FABRICS.get(path, None)
+    if not fabric:
+      with open(path, 'rb') as file_object:
+        definition = file_object.read()
+
+      fabric = dtfabric_fabric.DataTypeFabric(yaml_definition=definition)
+      cls._DEFINITION_FILES_FABRICS[path] = fabric
+
+    return fabric
 
 
 class BinaryDataFile(BinaryDataFormat):
@@ -1,12 +1,25 @@
 # -*- coding: utf-8 -*-
 """Timezone information files (TZif)."""
 
-from dtfabric.runtime import data_maps as dtfabric_data_maps
+import collections
+import concurrent.futures
+import io
+import mmap
+import os
+import stat
+import struct
 
 from dtformats import data_format
 from dtformats import errors
 
 
+TZifFileHeader = collections.namedtuple('TZifFileHeader', [
+    'signature', 'format_version', 'unknown1', 'number_of_utc_time_indicators',
+    'number_of_standard_time_indicators', 'number_of_leap_seconds',
+    'number_of_transition_times', 'number_of_local_time_types',
+    'timezone_abbreviation_strings_size'])
+
+
 class TimeZoneInformationFile(data_format.BinaryDataFile):
   """Timezone information file (TZif).
 
@@ -14,14 +27,36 @@ class TimeZoneInformationFile(data_format.BinaryDataFile):
     format_version (int): format version.
   """
 
-  # Using a class constant significantly speeds up the time required to load
-  # the dtFabric definition file.
-  _FABRIC = data_format.BinaryDataFile.ReadDefinitionFile('tzif.yaml')
-
   # TODO: move path into structure.
 
   _FILE_SIGNATURE = b'TZif'
 
+  _SUPPORTED_FORMAT_VERSIONS = frozenset([0x00, 0x32, 0x33])
+
+  # Format versions that contain 64-bit timezone information.
+  _64BIT_FORMAT_VERSIONS = frozenset([0x32, 0x33])
+
+  # The file header is fixed-size, hence it is decoded with a precompiled
+  # struct instead of the tzif_file_header dtFabric definition in tzif.yaml.
+  _FILE_HEADER_STRUCT = struct.Struct('>4sB15s6I')
+
+  _DEBUG_INFO_FILE_HEADER = [
+      ('signature', 'Signature', None),
+      ('format_version', 'Format version', '_FormatIntegerAsHexadecimal2'),
+      ('unknown1', 'Unknown1', '_FormatDataInHexadecimal'),
+      ('number_of_utc_time_indicators', 'Number of UTC time indicators',
+       '_FormatIntegerAsDecimal'),
+      ('number_of_standard_time_indicators',
+       'Number of standard time indicators', '_FormatIntegerAsDecimal'),
+      ('number_of_leap_seconds', 'Number of leap seconds',
+       '_FormatIntegerAsDecimal'),
+      ('number_of_transition_times', 'Number of transition times',
+       '_FormatIntegerAsDecimal'),
+      ('number_of_local_time_types', 'Number of local time types',
+       '_FormatIntegerAsDecimal'),
+      ('timezone_abbreviation_strings_size',
+       'Timezone abbreviation strings size', '_FormatIntegerAsDecimal')]
+
   def __init__(self, debug=False, output_writer=None):
     """Initializes a timezone information file.
 
@@ -33,348 +68,509 @@ class TimeZoneInformationFile(data_format.BinaryDataFile):
         debug=debug, output_writer=output_writer)
     self.format_version = None
 
-  def _DebugPrintFileHeader(self, file_header):
-    """Prints file header debug information.
+  def _DebugPrintTransitionTimeIndex(self, transition_time_index):
+    """Prints transition time index debug information.
 
     Args:
-      file_header (tzif_file_header): file header.
+      transition_time_index (memoryview): transition time index.
     """
-    value_string = '{0!s}'.format(file_header.signature)
-    self._DebugPrintValue('Signature', value_string)
+    lines = [
+        self._FormatValue(f'Type of local time: {index:d}', type_of_localtime)
+        for index, type_of_localtime in enumerate(transition_time_index)]
+    lines.append('\n')
 
-    value_string = '0x{0:02x}'.format(file_header.format_version)
-    self._DebugPrintValue('Format version', value_string)
+    # Write the debug information at once instead of per value.
+    self._DebugPrintText(''.join(lines))
 
-    self._DebugPrintData('Unknown1', file_header.unknown1)
+  def _DebugPrintTransitionTimes(self, transition_times):
+    """Prints transition times debug information.
 
-    value_string = '{0:d}'.format(file_header.number_of_utc_time_indicators)
-    self._DebugPrintValue('Number of UTC time indicators', value_string)
+    Args:
+      transition_times (Sequence[int]): transition times.
+    """
+    lines = [
+        self._FormatValue(f'Transition time: {index:d}', transition_time)
+        for index, transition_time in enumerate(transition_times)]
+    lines.append('\n')
 
-    value_string = '{0:d}'.format(
-        file_header.number_of_standard_time_indicators)
-    self._DebugPrintValue('Number of standard time indicators', value_string)
+    # Write the debug information at once instead of per value.
+    self._DebugPrintText(''.join(lines))
 
-    value_string = '{0:d}'.format(file_header.number_of_leap_seconds)
-    self._DebugPrintValue('Number of leap seconds', value_string)
+  def _DecodeTransitionTimes(self, data, transition_time_size):
+    """Decodes transition times.
 
-    value_string = '{0:d}'.format(file_header.number_of_transition_times)
-    self._DebugPrintValue('Number of transition times', value_string)
+    All big-endian transition times are decoded at once instead of mapping
+    every element with dtFabric.
 
-    value_string = '{0:d}'.format(file_header.number_of_local_time_types)
-    self._DebugPrintValue('Number of local time types', value_string)
+    Args:
+      data (memoryview): transition times data.
+      transition_time_size (int): size of a transition time, either 4 or 8.
 
-    value_string = '{0:d}'.format(
-        file_header.timezone_abbreviation_strings_size)
-    self._DebugPrintValue('Timezone abbreviation strings size', value_string)
+    Returns:
+      Sequence[int]: transition times.
+    """
+    number_of_transition_times = len(data) // transition_time_size
+    if transition_time_size == 4:
+      format_string = '>{0:d}i'.format(number_of_transition_times)
+    else:
+      format_string = '>{0:d}q'.format(number_of_transition_times)
 
-    self._DebugPrintText('\n')
+    return struct.unpack(format_string, data)
 
-  def _DebugPrintTransitionTimeIndex(self, transition_time_index):
-    """Prints transition time index debug information.
+  def _GetTimezoneInformationDataSize(self, file_header, time_size):
+    """Determines the size of the timezone information data.
 
     Args:
-      transition_time_index (tzif_transition_time_index): transition time index.
+      file_header (TZifFileHeader): file header.
+      time_size (int): size of a transition time and leap second occurrence,
+          4 for 32-bit and 8 for 64-bit timezone information.
+
+    Returns:
+      int: size of the timezone information data that follows the file header.
     """
-    for index, type_of_localtime in enumerate(transition_time_index):
-      description_string = 'Type of local time: {0:d}'.format(index)
-      value_string = '{0:d}'.format(type_of_localtime)
-      self._DebugPrintValue(description_string, value_string)
+    return (
+        (time_size + 1) * file_header.number_of_transition_times +
+        6 * file_header.number_of_local_time_types +
+        file_header.timezone_abbreviation_strings_size +
+        (time_size + 4) * file_header.number_of_leap_seconds +
+        file_header.number_of_standard_time_indicators +
+        file_header.number_of_utc_time_indicators)
 
-    self._DebugPrintText('\n')
+  def _IsRegularFile(self, file_object):
+    """Determines if a file-like object is a buffered regular file.
 
-  def _DebugPrintTransitionTimes(self, transition_times):
-    """Prints transition times debug information.
+    Args:
+      file_object (file): file-like object.
+
+    Returns:
+      bool: True if the file-like object is a buffered regular file.
+    """
+    if not isinstance(file_object, io.BufferedReader):
+      return False
+
+    try:
+      stat_object = os.fstat(file_object.fileno())
+    except (IOError, OSError):
+      return False
+
+    return stat.S_ISREG(stat_object.st_mode)
+
+  @classmethod
+  def _ParseFile(cls, path):
+    """Parses a timezone information file.
+
+    Args:
+      path (str): path of the file.
+
+    Returns:
+      TimeZoneInformationFile: timezone information file or None if the file
+          is not a supported timezone information file.
+    """
+    tzif_file = cls()
+
+    try:
+      # The file is opened without buffering to prevent reading more data than
+      # the signature for other types of files.
+      with open(path, 'rb', buffering=0) as file_object:
+        signature = file_object.read(4)
+        if signature != cls._FILE_SIGNATURE:
+          return None
+
+        data = b''.join([signature, file_object.read()])
+
+      tzif_file._ReadTimezoneInformationFile(memoryview(data))
+
+    except (IOError, OSError, errors.ParseError):
+      return None
+
+    return tzif_file
+
+  def _ReadFileData(self, file_object):
+    """Reads the entire content of a regular file without buffering.
+
+    The offset of the file-like object is not changed.
 
     Args:
-      transition_times (tzif_transition_times): transition times.
+      file_object (io.BufferedReader): file-like object of a regular file.
+
+    Returns:
+      bytes: content of the file.
     """
-    for index, transition_time in enumerate(transition_times):
-      description_string = 'Transition time: {0:d}'.format(index)
-      value_string = '{0:d}'.format(transition_time)
-      self._DebugPrintValue(description_string, value_string)
+    # Restore the offset of the underlying raw file, on which the state of
+    # the buffered reader depends.
+    raw_file_object = file_object.raw
+    raw_file_offset = raw_file_object.tell()
 
-    self._DebugPrintText('\n')
+    raw_file_object.seek(0, os.SEEK_SET)
+    try:
+      return raw_file_object.readall()
+    finally:
+      raw_file_object.seek(raw_file_offset, os.SEEK_SET)
 
-  def _ReadFileHeader(self, file_object):
+  def _ReadFileHeader(self, data, data_offset):
     """Reads a file header.
 
     Args:
-      file_object (file): file-like object.
+      data (memoryview): file data.
+      data_offset (int): offset of the file header relative to the start of
+          the file.
 
     Returns:
-      tzif_file_header: a file header.
+      TZifFileHeader: a file header.
 
     Raises:
       ParseError: if the file header cannot be read.
     """
-    data_type_map = self._GetDataTypeMap('tzif_file_header')
+    if len(data) - data_offset < self._FILE_HEADER_STRUCT.size:
+      raise errors.ParseError((
+          'Unable to read file header data at offset: 0x{0:08x} with error: '
+          'missing data').format(data_offset))
 
-    file_header, _ = self._ReadStructureFromFileObject(
-        file_object, 0, data_type_map, 'file header')
+    if self._debug:
+      data_end_offset = data_offset + self._FILE_HEADER_STRUCT.size
+
+      self._DebugPrintText('Reading file header at offset: 0x{0:08x}\n'.format(
+          data_offset))
+      self._DebugPrintData(
+          'File Header data', data[data_offset:data_end_offset])
+
+    file_header = TZifFileHeader(
+        *self._FILE_HEADER_STRUCT.unpack_from(data, data_offset))
 
     if self._debug:
-      self._DebugPrintFileHeader(file_header)
+      self._DebugPrintStructureObject(file_header, self._DEBUG_INFO_FILE_HEADER)
 
     if file_header.signature != self._FILE_SIGNATURE:
       raise errors.ParseError('Unsupported file signature.')
 
-    if file_header.format_version not in (0x00, 0x32, 0x33):
+    if file_header.format_version not in self._SUPPORTED_FORMAT_VERSIONS:
       raise errors.ParseError('Unsupported format version: {0:d}.'.format(
           file_header.format_version))
 
     return file_header
 
-  def _ReadLeapSecondRecords(self, file_object, file_header):
+  def _ReadLeapSecondRecords(self, data, data_offset, file_header, time_size):
     """Reads the lead second records.
 
     Args:
-      file_object (file): file-like object.
-      file_header (tzif_file_header): file header.
+      data (memoryview): file data.
+      data_offset (int): offset of the leap second records relative to
+          the start of the file.
+      file_header (TZifFileHeader): file header.
+      time_size (int): size of a leap second occurrence, 4 for 32-bit and 8
+          for 64-bit timezone information.
 
-    Raises:
-      ParseError: if the leap second records cannot be read.
+    Returns:
+      int: offset of the data following the leap second records.
     """
-    file_offset = file_object.tell()
-    data_size = 8 * file_header.number_of_leap_seconds
-
-    data = self._ReadData(
-        file_object, file_offset, data_size, 'leap second records')
+    # A leap second record consists of an occurrence and a 32-bit correction.
+    data_end_offset = data_offset + (
+        (time_size + 4) * file_header.number_of_leap_seconds)
 
     if self._debug:
-      self._DebugPrintData('Leap second records data', data)
+      self._DebugPrintData(
+          'Leap second records data', data[data_offset:data_end_offset])
 
-  def _ReadLocalTimeTypesTable(self, file_object, file_header):
+    return data_end_offset
+
+  def _ReadLocalTimeTypesTable(self, data, data_offset, file_header):
     """Reads the local time types table.
 
     Args:
-      file_object (file): file-like object.
-      file_header (tzif_file_header): file header.
+      data (memoryview): file data.
+      data_offset (int): offset of the local time types table relative to
+          the start of the file.
+      file_header (TZifFileHeader): file header.
 
-    Raises:
-      ParseError: if the local time types table cannot be read.
+    Returns:
+      int: offset of the data following the local time types table.
     """
-    file_offset = file_object.tell()
     # ttinfo structure
-    data_size = 6 * file_header.number_of_local_time_types
-
-    data = self._ReadData(
-        file_object, file_offset, data_size, 'local time types table')
+    data_end_offset = data_offset + 6 * file_header.number_of_local_time_types
 
     if self._debug:
-      self._DebugPrintData('Local time types table data', data)
+      self._DebugPrintData(
+          'Local time types table data', data[data_offset:data_end_offset])
+
+    return data_end_offset
 
-  def _ReadStandardTimeIndicators(self, file_object, file_header):
+  def _ReadStandardTimeIndicators(self, data, data_offset, file_header):
     """Reads the standard time indicators.
 
     Args:
-      file_object (file): file-like object.
-      file_header (tzif_file_header): file header.
+      data (memoryview): file data.
+      data_offset (int): offset of the standard time indicators relative to
+          the start of the file.
+      file_header (TZifFileHeader): file header.
 
-    Raises:
-      ParseError: if the standard time indicators cannot be read.
+    Returns:
+      int: offset of the data following the standard time indicators.
     """
-    file_offset = file_object.tell()
-    data_size = 1 * file_header.number_of_standard_time_indicators
-
-    data = self._ReadData(
-        file_object, file_offset, data_size, 'standard time indicators')
+    data_end_offset = (
+        data_offset + 1 * file_header.number_of_standard_time_indicators)
 
     if self._debug:
-      self._DebugPrintData('Standard time indicators data', data)
+      self._DebugPrintData(
+          'Standard time indicators data', data[data_offset:data_end_offset])
+
+    return data_end_offset
 
-  def _ReadTransitionTimeIndex(self, file_object, file_header):
+  def _ReadTransitionTimeIndex(self, data, data_offset, file_header):
     """Reads transition time index.
 
     Args:
-      file_object (file): file-like object.
-      file_header (tzif_file_header): file header.
+      data (memoryview): file data.
+      data_offset (int): offset of the transition time index relative to
+          the start of the file.
+      file_header (TZifFileHeader): file header.
 
-    Raises:
-      ParseError: if the transition time index cannot be read.
+    Returns:
+      int: offset of the data following the transition time index.
     """
-    file_offset = file_object.tell()
-    data_type_map = self._GetDataTypeMap('tzif_transition_time_index')
-
-    data_size = 1 * file_header.number_of_transition_times
-
-    data = self._ReadData(
-        file_object, file_offset, data_size, 'transition time index')
-
-    context = dtfabric_data_maps.DataTypeMapContext(values={
-        'tzif_file_header': file_header})
-
-    try:
-      transition_time_index = self._ReadStructureFromByteStream(
-          data, file_offset, data_type_map, 'transition time index',
-          context=context)
-    except (ValueError, errors.ParseError) as exception:
-      raise errors.ParseError((
-          'Unable to parse transition time index value with error: '
-          '{0!s}').format(exception))
+    data_end_offset = data_offset + 1 * file_header.number_of_transition_times
 
+    # The transition time index consists of 8-bit values, which iterating
+    # the data already provides.
     if self._debug:
+      transition_time_index = data[data_offset:data_end_offset]
       self._DebugPrintTransitionTimeIndex(transition_time_index)
 
-  def _ReadTimezoneAbbreviationStrings(self, file_object, file_header):
+    return data_end_offset
+
+  def _ReadTimezoneAbbreviationStrings(self, data, data_offset, file_header):
     """Reads timezone abbreviation strings.
 
     Args:
-      file_object (file): file-like object.
-      file_header (tzif_file_header): file header.
+      data (memoryview): file data.
+      data_offset (int): offset of the timezone abbreviation strings relative
+          to the start of the file.
+      file_header (TZifFileHeader): file header.
 
-    Raises:
-      ParseError: if the timezone abbreviation strings cannot be read.
+    Returns:
+      int: offset of the data following the timezone abbreviation strings.
     """
-    file_offset = file_object.tell()
-
-    data = self._ReadData(
-        file_object, file_offset,
-        file_header.timezone_abbreviation_strings_size,
-        'timezeone abbreviation strings')
+    data_end_offset = (
+        data_offset + file_header.timezone_abbreviation_strings_size)
 
     if self._debug:
-      self._DebugPrintData('Timezeone abbreviation strings data', data)
+      self._DebugPrintData(
+          'Timezeone abbreviation strings data',
+          data[data_offset:data_end_offset])
 
-  def _ReadTimezoneInformation32bit(self, file_object):
-    """Reads 32-bit timezone information.
+    return data_end_offset
+
+  def _ReadTimezoneInformation(self, data, data_offset, time_size):
+    """Reads timezone information.
 
     Args:
-      file_object (file): file-like object.
+      data (memoryview): file data.
+      data_offset (int): offset of the timezone information relative to
+          the start of the file.
+      time_size (int): size of a transition time and leap second occurrence,
+          4 for 32-bit and 8 for 64-bit timezone information.
+
+    Returns:
+      tuple[TZifFileHeader, int]: file header and offset of the data following
+          the timezone information.
 
     Raises:
-      ParseError: if the 32-bit timezone information cannot be read.
+      ParseError: if the timezone information cannot be read.
     """
-    file_header = self._ReadFileHeader(file_object)
+    file_header = self._ReadFileHeader(data, data_offset)
 
-    self.format_version = file_header.format_version
-
-    self._ReadTransitionTimes32bit(file_object, file_header)
-    self._ReadTransitionTimeIndex(file_object, file_header)
-    self._ReadLocalTimeTypesTable(file_object, file_header)
-    self._ReadTimezoneAbbreviationStrings(file_object, file_header)
-    self._ReadLeapSecondRecords(file_object, file_header)
-    self._ReadStandardTimeIndicators(file_object, file_header)
-    self._ReadUTCTimeIndicators(file_object, file_header)
+    data_offset += self._FILE_HEADER_STRUCT.size
+    data_size = self._GetTimezoneInformationDataSize(file_header, time_size)
 
-  def _ReadTimezoneInformation64bit(self, file_object):
-    """Reads 64-bit timezone information.
+    # Check the sizes in the file header against the file size before reading
+    # the timezone information data.
+    if data_size > len(data) - data_offset:
+      raise errors.ParseError((
+          'Size of {0:d}-bit timezone information data: {1:d} at offset: '
+          '0x{2:08x} exceeds file size.').format(
+              time_size * 8, data_size, data_offset))
+
+    # The timezone information data is only used for debug output, hence
+    # skip it in non-debug mode.
+    if not self._debug:
+      return file_header, data_offset + data_size
+
+    data_offset = self._ReadTransitionTimes(
+        data, data_offset, file_header, time_size)
+    data_offset = self._ReadTransitionTimeIndex(data, data_offset, file_header)
+    data_offset = self._ReadLocalTimeTypesTable(data, data_offset, file_header)
+    data_offset = self._ReadTimezoneAbbreviationStrings(
+        data, data_offset, file_header)
+    data_offset = self._ReadLeapSecondRecords(
+        data, data_offset, file_header, time_size)
+    data_offset = self._ReadStandardTimeIndicators(
+        data, data_offset, file_header)
+    data_offset = self._ReadUTCTimeIndicators(data, data_offset, file_header)
+
+    return file_header, data_offset
+
+  def _ReadTimezoneInformationFile(self, data):
+    """Reads the timezone information of a file.
+
+    Format version 2 and later files contain 32-bit timezone information
+    followed by 64-bit timezone information and a timezone string.
 
     Args:
-      file_object (file): file-like object.
+      data (memoryview): file data.
 
     Raises:
-      ParseError: if the 64-bit timezone information cannot be read.
+      ParseError: if the timezone information cannot be read.
     """
-    file_header = self._ReadFileHeader(file_object)
+    file_header, data_offset = self._ReadTimezoneInformation(data, 0, 4)
 
-    self._ReadTransitionTimes64bit(file_object, file_header)
-    self._ReadTransitionTimeIndex(file_object, file_header)
-    self._ReadLocalTimeTypesTable(file_object, file_header)
-    self._ReadTimezoneAbbreviationStrings(file_object, file_header)
-    self._ReadLeapSecondRecords(file_object, file_header)
-    self._ReadStandardTimeIndicators(file_object, file_header)
-    self._ReadUTCTimeIndicators(file_object, file_header)
+    self.format_version = file_header.format_version
+
+    if self.format_version in self._64BIT_FORMAT_VERSIONS:
+      _, data_offset = self._ReadTimezoneInformation(data, data_offset, 8)
+
+      if self._debug:
+        self._DebugPrintData('Timezone string', data[data_offset:])
 
-  def _ReadTransitionTimes32bit(self, file_object, file_header):
-    """Reads 32-bit transition times.
+  def _ReadTransitionTimes(self, data, data_offset, file_header, time_size):
+    """Reads transition times.
 
     Args:
-      file_object (file): file-like object.
-      file_header (tzif_file_header): file header.
+      data (memoryview): file data.
+      data_offset (int): offset of the transition times relative to the start
+          of the file.
+      file_header (TZifFileHeader): file header.
+      time_size (int): size of a transition time, 4 for 32-bit and 8 for
+          64-bit timezone information.
 
-    Raises:
-      ParseError: if the 32-bit transition times cannot be read.
+    Returns:
+      int: offset of the data following the transition times.
     """
-    file_offset = file_object.tell()
-    data_type_map = self._GetDataTypeMap('tzif_transition_times_32bit')
+    data_end_offset = data_offset + (
+        time_size * file_header.number_of_transition_times)
 
-    data_size = 4 * file_header.number_of_transition_times
+    # The transition times are only used for debug output, hence only decode
+    # them in debug mode.
+    if self._debug:
+      transition_times = self._DecodeTransitionTimes(
+          data[data_offset:data_end_offset], time_size)
+      self._DebugPrintTransitionTimes(transition_times)
 
-    data = self._ReadData(
-        file_object, file_offset, data_size, '32-bit transition times')
+    return data_end_offset
 
-    context = dtfabric_data_maps.DataTypeMapContext(values={
-        'tzif_file_header': file_header})
+  def _ReadUTCTimeIndicators(self, data, data_offset, file_header):
+    """Reads the UTC time indicators.
 
-    try:
-      transition_times = self._ReadStructureFromByteStream(
-          data, file_offset, data_type_map, '32-bit transition times',
-          context=context)
-    except (ValueError, errors.ParseError) as exception:
-      raise errors.ParseError((
-          'Unable to parse 32-bit transition times value with error: '
-          '{0!s}').format(exception))
+    Args:
+      data (memoryview): file data.
+      data_offset (int): offset of the UTC time indicators relative to
+          the start of the file.
+      file_header (TZifFileHeader): file header.
+
+    Returns:
+      int: offset of the data following the UTC time indicators.
+    """
+    data_end_offset = (
+        data_offset + 1 * file_header.number_of_utc_time_indicators)
 
     if self._debug:
-      self._DebugPrintTransitionTimes(transition_times)
+      self._DebugPrintData(
+          'UTC time indicators data', data[data_offset:data_end_offset])
+
+    return data_end_offset
+
+  def Open(self, path):
+    """Opens a timezone information file.
 
-  def _ReadTransitionTimes64bit(self, file_object, file_header):
-    """Reads 64-bit transition times.
+    The file is memory mapped and decoded in place, without copying its
+    content. The memory map is only used while reading the file and is closed
+    afterwards.
 
     Args:
-      file_object (file): file-like object.
-      file_header (tzif_file_header): file header.
+      path (str): path to the file.
 
     Raises:
-      ParseError: if the 64-bit transition times cannot be read.
+      IOError: if the file is already opened.
+      OSError: if the file is already opened.
+      ParseError: if the file cannot be read.
     """
-    file_offset = file_object.tell()
-    data_type_map = self._GetDataTypeMap('tzif_transition_times_64bit')
-
-    data_size = 8 * file_header.number_of_transition_times
-
-    data = self._ReadData(
-        file_object, file_offset, data_size, '64-bit transition times')
+    if self._file_object:
+      raise IOError('File already opened')
 
-    context = dtfabric_data_maps.DataTypeMapContext(values={
-        'tzif_file_header': file_header})
+    file_object = open(path, 'rb')  # pylint: disable=consider-using-with
 
     try:
-      transition_times = self._ReadStructureFromByteStream(
-          data, file_offset, data_type_map, '64-bit transition times',
-          context=context)
-    except (ValueError, errors.ParseError) as exception:
-      raise errors.ParseError((
-          'Unable to parse 64-bit transition times value with error: '
-          '{0!s}').format(exception))
-
-    if self._debug:
-      self._DebugPrintTransitionTimes(transition_times)
-
-  def _ReadUTCTimeIndicators(self, file_object, file_header):
-    """Reads the UTC time indicators.
+      file_size = os.fstat(file_object.fileno()).st_size
+
+      # Note that an empty file cannot be memory mapped.
+      if not file_size:
+        self._ReadTimezoneInformationFile(memoryview(b''))
+      else:
+        with mmap.mmap(
+            file_object.fileno(), 0, access=mmap.ACCESS_READ) as memory_map:
+          # The memory view must be released before the memory map is closed.
+          with memoryview(memory_map) as data:
+            self._ReadTimezoneInformationFile(data)
+
+      self._file_object = file_object
+      self._file_object_opened_in_object = True
+      self._file_size = file_size
+      self._path = path
+
+    finally:
+      # Close the file if it could not be read.
+      if not self._file_object:
+        file_object.close()
+
+  @classmethod
+  def ParseDirectory(cls, path, maximum_number_of_workers=None):
+    """Parses the timezone information files in a directory.
+
+    The files are parsed in parallel, since reading the files is I/O bound.
+    Files that are not supported timezone information files are ignored.
 
     Args:
-      file_object (file): file-like object.
-      file_header (tzif_file_header): file header.
+      path (str): path of the directory, such as /usr/share/zoneinfo.
+      maximum_number_of_workers (Optional[int]): maximum number of threads to
+          parse the files with, where None represents the number of CPUs.
 
-    Raises:
-      ParseError: if the UTC time indicators cannot be read.
+    Returns:
+      dict[str, TimeZoneInformationFile]: timezone information files per path.
     """
-    file_offset = file_object.tell()
-    data_size = 1 * file_header.number_of_utc_time_indicators
+    if maximum_number_of_workers is None:
+      maximum_number_of_workers = os.cpu_count()
 
-    data = self._ReadData(
-        file_object, file_offset, data_size, 'UTC time indicators')
+    paths = []
+    for directory_path, _, filenames in os.walk(path):
+      for filename in sorted(filenames):
+        file_path = os.path.join(directory_path, filename)
+        if os.path.isfile(file_path):
+          paths.append(file_path)
 
-    if self._debug:
-      self._DebugPrintData('UTC time indicators data', data)
+    with concurrent.futures.ThreadPoolExecutor(
+        max_workers=maximum_number_of_workers) as executor:
+      tzif_files = executor.map(cls._ParseFile, paths)
+
+      return {
+          file_path: tzif_file
+          for file_path, tzif_file in zip(paths, tzif_files) if tzif_file}
 
   def ReadFileObject(self, file_object):
     """Reads a timezone information file-like object.
 
+    The entire file-like object is read from offset 0, regardless of its
+    current offset.
+
     Args:
       file_object (file): file-like object.
 
     Raises:
       ParseError: if the file cannot be read.
     """
-    self._ReadTimezoneInformation32bit(file_object)
-
-    if self.format_version in (0x32, 0x33):
-      self._ReadTimezoneInformation64bit(file_object)
-
+    # Timezone information files are small and read once, hence for regular
+    # files read the entire file at once, bypassing the buffered reader.
+    if self._IsRegularFile(file_object):
+      data = self._ReadFileData(file_object)
+    else:
+      file_object.seek(0, os.SEEK_SET)
       data = file_object.read()
 
-      if self._debug:
-        self._DebugPrintData('Timezone string', data)
+    self._ReadTimezoneInformationFile(memoryview(data))
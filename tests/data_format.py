@@ -259,7 +259,17 @@ class BinaryDataFormatTest(test_lib.BaseTestCase):
     with self.assertRaises(errors.ParseError):
       test_format._ReadData(file_object, 0, test_format.POINT3D_SIZE, 'point3d')
 
-  # TODO: add tests for _ReadDefinitionFile
+  def testReadDefinitionFile(self):
+    """Tests the ReadDefinitionFile function."""
+    fabric = data_format.BinaryDataFormat.ReadDefinitionFile('asl.yaml')
+    self.assertIsNotNone(fabric)
+
+    # Test that the definition file is only read once.
+    cached_fabric = data_format.BinaryDataFormat.ReadDefinitionFile('asl.yaml')
+    self.assertIs(cached_fabric, fabric)
+
+    fabric = data_format.BinaryDataFormat.ReadDefinitionFile(None)
+    self.assertIsNone(fabric)
 
   def testReadStructure(self):
     """Tests the _ReadStructure function."""
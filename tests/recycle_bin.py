@@ -1,6 +1,8 @@
 # -*- coding: utf-8 -*-
 """Tests for Windows Recycle.Bin metadata ($I) files."""
 
+import io
+import os
 import unittest
 
 from dtformats import recycle_bin
@@ -13,16 +15,45 @@ class RecycleBinMetadataFileTest(test_lib.BaseTestCase):
 
   # pylint: disable=protected-access
 
+  _TEST_FILENAMES = ['$II3DF3L.zip', '$I103S5F.jpg']
+
+  @classmethod
+  def setUpClass(cls):
+    """Reads the test files once for all tests."""
+    cls._test_files_data = {}
+
+    for filename in cls._TEST_FILENAMES:
+      test_file_path = os.path.join(cls._TEST_DATA_PATH, filename)
+      if os.path.exists(test_file_path):
+        with open(test_file_path, 'rb') as file_object:
+          cls._test_files_data[filename] = file_object.read()
+
+  def _GetTestFileObject(self, filename):
+    """Retrieves a file-like object of a test file.
+
+    Args:
+      filename (str): name of the test file.
+
+    Returns:
+      io.BytesIO: file-like object of the test file.
+
+    Raises:
+      SkipTest: if the test file does not exist and the test should be
+          skipped.
+    """
+    data = self._test_files_data.get(filename, None)
+    if data is None:
+      raise unittest.SkipTest('missing test file: {0:s}'.format(filename))
+
+    return io.BytesIO(data)
+
   def testReadFileHeader(self):
     """Tests the _ReadFileHeader function."""
     output_writer = test_lib.TestOutputWriter()
     test_file = recycle_bin.RecycleBinMetadataFile(output_writer=output_writer)
 
-    test_file_path = self._GetTestFilePath(['$II3DF3L.zip'])
-    self._SkipIfPathNotExists(test_file_path)
-
-    with open(test_file_path, 'rb') as file_object:
-      file_header = test_file._ReadFileHeader(file_object)
+    file_object = self._GetTestFileObject('$II3DF3L.zip')
+    file_header = test_file._ReadFileHeader(file_object)
 
     self.assertEqual(file_header.format_version, 1)
     self.assertEqual(file_header.original_file_size, 724919)
@@ -33,13 +64,10 @@ class RecycleBinMetadataFileTest(test_lib.BaseTestCase):
     output_writer = test_lib.TestOutputWriter()
     test_file = recycle_bin.RecycleBinMetadataFile(output_writer=output_writer)
 
-    test_file_path = self._GetTestFilePath(['$II3DF3L.zip'])
-    self._SkipIfPathNotExists(test_file_path)
-
-    with open(test_file_path, 'rb') as file_object:
-      file_header = test_file._ReadFileHeader(file_object)
-      original_filename = test_file._ReadOriginalFilename(
-          file_object, file_header.format_version)
+    file_object = self._GetTestFileObject('$II3DF3L.zip')
+    file_header = test_file._ReadFileHeader(file_object)
+    original_filename = test_file._ReadOriginalFilename(
+        file_object, file_header.format_version)
 
     expected_original_filename = (
         'C:\\Users\\bogus\\Documents\\RandomResearch\\Archives.zip')
@@ -51,10 +79,10 @@ class RecycleBinMetadataFileTest(test_lib.BaseTestCase):
     test_file = recycle_bin.RecycleBinMetadataFile(
         debug=True, output_writer=output_writer)
 
-    test_file_path = self._GetTestFilePath(['$II3DF3L.zip'])
-    self._SkipIfPathNotExists(test_file_path)
+    file_object = self._GetTestFileObject('$II3DF3L.zip')
+    test_file.ReadFileObject(file_object)
 
-    test_file.Open(test_file_path)
+    self.assertEqual(test_file.format_version, 1)
 
   def testReadFileObjectFormatVersion2(self):
     """Tests the ReadFileObject function on a format version 2 file."""
@@ -62,10 +90,10 @@ class RecycleBinMetadataFileTest(test_lib.BaseTestCase):
     test_file = recycle_bin.RecycleBinMetadataFile(
         debug=True, output_writer=output_writer)
 
-    test_file_path = self._GetTestFilePath(['$I103S5F.jpg'])
-    self._SkipIfPathNotExists(test_file_path)
+    file_object = self._GetTestFileObject('$I103S5F.jpg')
+    test_file.ReadFileObject(file_object)
 
-    test_file.Open(test_file_path)
+    self.assertEqual(test_file.format_version, 2)
 
 
 if __name__ == '__main__':
@@ -1,8 +1,12 @@
 # -*- coding: utf-8 -*-
 """Tests for Timezone information files (TZif)."""
 
+import io
+import os
+import tempfile
 import unittest
 
+from dtformats import errors
 from dtformats import tzif
 
 from tests import test_lib
@@ -13,14 +17,12 @@ class TimeZoneInformationFileTest(test_lib.BaseTestCase):
 
   # pylint: disable=protected-access
 
-  def testDebugPrintFileHeader(self):
-    """Tests the _DebugPrintFileHeader function."""
+  def testDebugInfoFileHeader(self):
+    """Tests the file header debug information."""
     output_writer = test_lib.TestOutputWriter()
     test_file = tzif.TimeZoneInformationFile(output_writer=output_writer)
 
-    data_type_map = test_file._GetDataTypeMap('tzif_file_header')
-
-    file_header = data_type_map.CreateStructureValues(
+    file_header = tzif.TZifFileHeader(
         format_version=0x32,
         number_of_leap_seconds=1,
         number_of_local_time_types=2,
@@ -32,10 +34,54 @@ class TimeZoneInformationFileTest(test_lib.BaseTestCase):
         unknown1=(
             b'\x00\x01\x02\x03\x04\x05\x06\x07\x08\x09\x0a\x0b\x0c\x0d\x0e'))
 
-    test_file._DebugPrintFileHeader(file_header)
+    test_file._DebugPrintStructureObject(
+        file_header, test_file._DEBUG_INFO_FILE_HEADER)
+
+    output = ''.join(output_writer.output)
+    self.assertIn('Format version', output)
+    self.assertIn(': 0x32\n', output)
+    self.assertIn('Timezone abbreviation strings size', output)
 
-  # TODO: add tests for _DebugPrintTransitionTimeIndex
-  # TODO: add tests for _DebugPrintTransitionTimes
+  def testDebugPrintTransitionTimeIndex(self):
+    """Tests the _DebugPrintTransitionTimeIndex function."""
+    output_writer = test_lib.TestOutputWriter()
+    test_file = tzif.TimeZoneInformationFile(output_writer=output_writer)
+
+    test_file._DebugPrintTransitionTimeIndex(memoryview(b'\x01\x02'))
+
+    expected_output = (
+        'Type of local time: 0\t\t\t\t\t\t\t: 1\n'
+        'Type of local time: 1\t\t\t\t\t\t\t: 2\n'
+        '\n')
+    self.assertEqual(''.join(output_writer.output), expected_output)
+    self.assertEqual(len(output_writer.output), 1)
+
+  def testDebugPrintTransitionTimes(self):
+    """Tests the _DebugPrintTransitionTimes function."""
+    output_writer = test_lib.TestOutputWriter()
+    test_file = tzif.TimeZoneInformationFile(output_writer=output_writer)
+
+    test_file._DebugPrintTransitionTimes((-1855958901, 0))
+
+    expected_output = (
+        'Transition time: 0\t\t\t\t\t\t\t: -1855958901\n'
+        'Transition time: 1\t\t\t\t\t\t\t: 0\n'
+        '\n')
+    self.assertEqual(''.join(output_writer.output), expected_output)
+    self.assertEqual(len(output_writer.output), 1)
+
+  def testDecodeTransitionTimes(self):
+    """Tests the _DecodeTransitionTimes function."""
+    output_writer = test_lib.TestOutputWriter()
+    test_file = tzif.TimeZoneInformationFile(output_writer=output_writer)
+
+    transition_times = test_file._DecodeTransitionTimes(
+        memoryview(b'\x91\x60\x50\x8b\x00\x00\x00\x01'), 4)
+    self.assertEqual(transition_times, (-1855958901, 1))
+
+    transition_times = test_file._DecodeTransitionTimes(
+        memoryview(b'\xff\xff\xff\xff\x91\x60\x50\x8b'), 8)
+    self.assertEqual(transition_times, (-1855958901,))
 
   def testReadFileHeader(self):
     """Tests the _ReadFileHeader function."""
@@ -46,19 +92,113 @@ class TimeZoneInformationFileTest(test_lib.BaseTestCase):
     self._SkipIfPathNotExists(test_file_path)
 
     with open(test_file_path, 'rb') as file_object:
-      test_file._ReadFileHeader(file_object)
+      data = file_object.read()
+
+    file_header = test_file._ReadFileHeader(memoryview(data), 0)
+
+    self.assertEqual(file_header.signature, b'TZif')
+    self.assertEqual(file_header.format_version, 0x32)
+    self.assertEqual(file_header.number_of_transition_times, 183)
+    self.assertEqual(file_header.number_of_local_time_types, 12)
+
+    with self.assertRaises(errors.ParseError):
+      test_file._ReadFileHeader(memoryview(data[:32]), 0)
 
   # TODO: add tests for _ReadLeapSecondRecords
   # TODO: add tests for _ReadLocalTimeTypesTable
   # TODO: add tests for _ReadStandardTimeIndicators
   # TODO: add tests for _ReadTransitionTimeIndex
   # TODO: add tests for _ReadTimezoneAbbreviationStrings
-  # TODO: add tests for _ReadTimezoneInformation32bit
-  # TODO: add tests for _ReadTimezoneInformation64bit
-  # TODO: add tests for _ReadTransitionTimes32bit
-  # TODO: add tests for _ReadTransitionTimes64bit
+
+  def testReadTimezoneInformation(self):
+    """Tests the _ReadTimezoneInformation function."""
+    output_writer = test_lib.TestOutputWriter()
+    test_file = tzif.TimeZoneInformationFile(output_writer=output_writer)
+
+    test_file_path = self._GetTestFilePath(['localtime.tzif'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    with open(test_file_path, 'rb') as file_object:
+      data = memoryview(file_object.read())
+
+    file_header, data_offset = test_file._ReadTimezoneInformation(data, 0, 4)
+    self.assertEqual(file_header.number_of_transition_times, 183)
+    self.assertEqual(data_offset, 1082)
+
+    file_header, data_offset = test_file._ReadTimezoneInformation(
+        data, data_offset, 8)
+    self.assertEqual(file_header.number_of_transition_times, 184)
+    self.assertEqual(data_offset, 2917)
+
+    self.assertEqual(
+        data[data_offset:].tobytes(), b'\nCET-1CEST,M3.5.0,M10.5.0/3\n')
+
+  # TODO: add tests for _ReadTimezoneInformationFile
+
+  def testReadTransitionTimes(self):
+    """Tests the _ReadTransitionTimes function."""
+    output_writer = test_lib.TestOutputWriter()
+    test_file = tzif.TimeZoneInformationFile(
+        debug=True, output_writer=output_writer)
+
+    test_file_path = self._GetTestFilePath(['localtime.tzif'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    with open(test_file_path, 'rb') as file_object:
+      data = memoryview(file_object.read())
+
+    file_header = test_file._ReadFileHeader(data, 0)
+
+    data_offset = test_file._ReadTransitionTimes(data, 44, file_header, 4)
+    self.assertEqual(data_offset, 44 + (4 * 183))
+
+    self.assertIn('-1855958901', ''.join(output_writer.output))
+
   # TODO: add tests for _ReadUTCTimeIndicators
 
+  def testOpenWithTruncatedFile(self):
+    """Tests the Open function with a truncated file."""
+    output_writer = test_lib.TestOutputWriter()
+    test_file = tzif.TimeZoneInformationFile(output_writer=output_writer)
+
+    test_file_path = self._GetTestFilePath(['localtime.tzif'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    with open(test_file_path, 'rb') as file_object:
+      data = file_object.read(1000)
+
+    with tempfile.TemporaryDirectory() as temporary_directory:
+      truncated_file_path = os.path.join(temporary_directory, 'truncated.tzif')
+      with open(truncated_file_path, 'wb') as file_object:
+        file_object.write(data)
+
+      with self.assertRaises(errors.ParseError):
+        test_file.Open(truncated_file_path)
+
+      self.assertIsNone(test_file._file_object)
+      self.assertIsNone(test_file._path)
+
+      with self.assertRaises(IOError):
+        test_file.Close()
+
+      # The file can be opened again after it could not be read.
+      with self.assertRaises(errors.ParseError):
+        test_file.Open(truncated_file_path)
+
+    test_file.Open(test_file_path)
+    test_file.Close()
+
+  def testParseDirectory(self):
+    """Tests the ParseDirectory function."""
+    test_file_path = self._GetTestFilePath(['localtime.tzif'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    tzif_files = tzif.TimeZoneInformationFile.ParseDirectory(
+        self._TEST_DATA_PATH)
+
+    self.assertEqual(list(tzif_files.keys()), [test_file_path])
+    self.assertEqual(tzif_files[test_file_path].format_version, 0x32)
+
   def testReadFileObject(self):
     """Tests the ReadFileObject function."""
     output_writer = test_lib.TestOutputWriter()
@@ -70,6 +210,65 @@ class TimeZoneInformationFileTest(test_lib.BaseTestCase):
 
     test_file.Open(test_file_path)
 
+    self.assertEqual(test_file.format_version, 0x32)
+
+    test_file.Close()
+
+  def testReadFileObjectWithBytesIO(self):
+    """Tests the ReadFileObject function with a file-like object in memory."""
+    output_writer = test_lib.TestOutputWriter()
+    test_file = tzif.TimeZoneInformationFile(
+        debug=True, output_writer=output_writer)
+
+    test_file_path = self._GetTestFilePath(['localtime.tzif'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    with open(test_file_path, 'rb') as file_object:
+      data = file_object.read()
+
+    test_file.ReadFileObject(io.BytesIO(data))
+
+    self.assertEqual(test_file.format_version, 0x32)
+
+  def testReadFileObjectWithFileOffset(self):
+    """Tests the ReadFileObject function with a file at a non-zero offset."""
+    output_writer = test_lib.TestOutputWriter()
+    test_file = tzif.TimeZoneInformationFile(output_writer=output_writer)
+
+    test_file_path = self._GetTestFilePath(['localtime.tzif'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    with open(test_file_path, 'rb') as file_object:
+      data = file_object.read()
+
+    with open(test_file_path, 'rb') as file_object:
+      file_object.read(100)
+      test_file.ReadFileObject(file_object)
+
+      self.assertEqual(test_file.format_version, 0x32)
+      self.assertEqual(file_object.tell(), 100)
+      self.assertEqual(file_object.read(16), data[100:116])
+
+  def testReadFileObjectWithTruncatedData(self):
+    """Tests the ReadFileObject function with truncated data."""
+    output_writer = test_lib.TestOutputWriter()
+    test_file = tzif.TimeZoneInformationFile(output_writer=output_writer)
+
+    test_file_path = self._GetTestFilePath(['localtime.tzif'])
+    self._SkipIfPathNotExists(test_file_path)
+
+    with open(test_file_path, 'rb') as file_object:
+      data = file_object.read(1024)
+
+    with self.assertRaises(errors.ParseError):
+      test_file.ReadFileObject(io.BytesIO(data))
+
+    # Number of transition times of 0xffffffff.
+    data = b''.join([data[:32], b'\xff\xff\xff\xff', data[36:]])
+
+    with self.assertRaises(errors.ParseError):
+      test_file.ReadFileObject(io.BytesIO(data))
+
 
 if __name__ == '__main__':
   unittest.main()